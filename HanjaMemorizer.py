@@ -11,9 +11,14 @@
 import sys
 import os
 import json
-import random
+import hashlib
 import re
+from functools import lru_cache, partial
+from itertools import islice
 from datetime import datetime
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import numpy as np
 import pandas as pd
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -21,9 +26,30 @@ from PyQt5.QtWidgets import (
     QGroupBox, QProgressBar, QComboBox, QLineEdit, QDialog, QDialogButtonBox,
     QCheckBox, QButtonGroup, QRadioButton
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QStandardItem, QStandardItemModel
 
+# 엑셀 파서: python-calamine(Rust)이 있고 pandas가 지원하면(2.2+) 사용, 아니면 pandas 기본 엔진
+EXCEL_ENGINE = None
+try:
+    import python_calamine  # noqa: F401
+    if tuple(int(v) for v in re.findall(r'\d+', pd.__version__)[:2]) >= (2, 2):
+        EXCEL_ENGINE = "calamine"
+except ImportError:
+    pass
+
+# CSV 파서: pyarrow가 있으면 사용 (GIL 해제 + 멀티스레드 파싱)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# JSON 직렬화: orjson이 있으면 사용 (캐시 파일 읽기/쓰기 속도 향상)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 캐시 디렉토리 설정 (py파일이 있는 폴더에 저장)
 def get_app_dir():
@@ -39,6 +65,43 @@ APP_DIR = get_app_dir()
 DATA_DIR = os.path.join(APP_DIR, "data")
 CACHE_INDEX_FILE = os.path.join(DATA_DIR, "cache_index.json")
 MEMORIZED_FILE = os.path.join(DATA_DIR, "memorized_hanja.json")
+MAX_CACHE_FILES = 20
+
+# 읽어 올 열 위치: 번호, 한자, 음, 뜻
+DATA_COLUMNS = range(4)
+CACHE_INDEX_VERSION = 2
+
+# 드롭다운에 표시할 소스 타입별 아이콘
+SOURCE_TYPE_ICONS = {"google": "☁️", "local": "💻"}
+
+# 구글 시트 URL에서 ID를 찾는 패턴 / 캐시 파일명에 쓸 수 없는 문자
+GOOGLE_SHEET_ID_PATTERNS = (
+    re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)'),
+    re.compile(r'id=([a-zA-Z0-9-_]+)'),
+)
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^\w\-_]')
+
+
+def json_dumps_bytes(obj):
+    """객체를 UTF-8 JSON 바이트로 직렬화 (들여쓰기 없음)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads_bytes(raw):
+    """UTF-8 JSON 바이트를 객체로 역직렬화"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8-sig'))
+
+
+def write_file_atomic(path, raw):
+    """임시 파일에 한 번에 쓴 뒤 교체 (저장 중 종료돼도 파일이 깨지지 않음)"""
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_file, path)
 
 
 def ensure_data_dir():
@@ -48,22 +111,37 @@ def ensure_data_dir():
 
 
 def load_cache_index():
-    """캐시 인덱스 로드"""
+    """캐시 인덱스 로드
+
+    files: {source_path: 파일 정보} (오래된 것 -> 최신 순서)
+    """
     ensure_data_dir()
     if os.path.exists(CACHE_INDEX_FILE):
         try:
-            with open(CACHE_INDEX_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(CACHE_INDEX_FILE, 'rb') as f:
+                index = json_loads_bytes(f.read())
         except:
-            return {"files": []}
-    return {"files": []}
+            return {"version": CACHE_INDEX_VERSION, "files": {}}
+        
+        if index.get("version", 1) < CACHE_INDEX_VERSION:
+            # v1 형식: 최신 순서의 리스트 -> source_path 키 딕셔너리로 변환
+            files = index.get("files", [])
+            if isinstance(files, list):
+                index["files"] = {f["source_path"]: f for f in reversed(files)}
+            index["version"] = CACHE_INDEX_VERSION
+        return index
+    return {"version": CACHE_INDEX_VERSION, "files": {}}
 
 
 def save_cache_index(index):
     """캐시 인덱스 저장"""
     ensure_data_dir()
-    with open(CACHE_INDEX_FILE, 'w', encoding='utf-8') as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
+    index["version"] = CACHE_INDEX_VERSION
+    if orjson is not None:
+        raw = orjson.dumps(index, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(index, ensure_ascii=False, indent=2).encode('utf-8')
+    write_file_atomic(CACHE_INDEX_FILE, raw)
 
 
 def load_memorized_hanja():
@@ -115,65 +193,255 @@ def get_memorized_count():
     return len(data["memorized"])
 
 
-def add_to_cache(name, source_type, source_path, data):
-    """데이터를 캐시에 추가"""
+def add_to_cache(name, source_type, source_path, hanjas, readings, meanings, validators=None):
+    """데이터를 캐시에 추가 (한자/음/뜻 열 단위로 저장)
+    
+    validators: 구글 시트 응답의 {"etag", "last_modified"} (다음 조건부 요청에 사용)
+    반환: (캐시 파일명, 더 이상 쓰이지 않는 캐시 파일명 리스트)
+    파일 삭제는 호출한 쪽에서 remove_cache_file로 나중에 처리한다.
+    """
     ensure_data_dir()
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = re.sub(r'[^\w\-_]', '_', name)[:50]
-    cache_filename = f"{safe_name}_{timestamp}.json"
+    safe_name = UNSAFE_FILENAME_PATTERN.sub('_', name)[:50]
+    digest = content_hash(hanjas, readings, meanings)
+    cache_filename = f"{safe_name}_{digest}.json"
     cache_filepath = os.path.join(DATA_DIR, cache_filename)
     
-    with open(cache_filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # 내용이 같은 파일이 이미 있으면 다시 쓰지 않음
+    # (존재 여부만 보므로 중간에 끊겨 잘린 파일이 남지 않도록 원자적으로 저장)
+    if not os.path.exists(cache_filepath):
+        data = {"hanja": hanjas, "reading": readings, "meaning": meanings}
+        write_file_atomic(cache_filepath, json_dumps_bytes(data))
     
-    index = load_cache_index()
-    index["files"] = [f for f in index["files"] if f.get("source_path") != source_path]
-    
-    index["files"].insert(0, {
+    stale_files = put_cache_entry({
         "name": name,
         "source_type": source_type,
         "source_path": source_path,
         "cache_file": cache_filename,
         "cached_at": timestamp,
-        "count": len(data)
+        "count": len(hanjas),
+        **(validators or {})
     })
+    return cache_filename, stale_files
+
+
+def touch_cache_entry(file_info, name):
+    """내용이 그대로인 캐시 항목을 새 이름/시각으로 최신 위치에 다시 넣기
     
-    if len(index["files"]) > 20:
-        old_files = index["files"][20:]
-        index["files"] = index["files"][:20]
-        
-        for old in old_files:
-            old_path = os.path.join(DATA_DIR, old["cache_file"])
-            if os.path.exists(old_path):
-                os.remove(old_path)
+    반환: 더 이상 쓰이지 않는 캐시 파일명 리스트
+    """
+    return put_cache_entry({
+        **file_info,
+        "name": name,
+        "cached_at": datetime.now().strftime("%Y%m%d_%H%M%S")
+    })
+
+
+def put_cache_entry(entry):
+    """인덱스에 항목을 최신으로 넣고 오래된 항목 정리
+    
+    반환: 더 이상 쓰이지 않는 캐시 파일명 리스트
+    """
+    index = load_cache_index()
+    files = index["files"]
+    
+    # 같은 소스는 제거 후 맨 뒤(최신)에 다시 추가
+    removed = []
+    previous = files.pop(entry["source_path"], None)
+    if previous:
+        removed.append(previous)
+    files[entry["source_path"]] = entry
+    
+    excess = len(files) - MAX_CACHE_FILES
+    if excess > 0:
+        for key in list(islice(files, excess)):
+            removed.append(files.pop(key))
+    
+    # 다른 항목이 아직 쓰고 있는 캐시 파일은 남겨둠
+    in_use = {f["cache_file"] for f in files.values()}
+    stale_files = list({old["cache_file"] for old in removed} - in_use)
     
     save_cache_index(index)
-    return cache_filepath
+    return stale_files
+
+
+def content_hash(hanjas, readings, meanings):
+    """한자/음/뜻 내용으로 캐시 파일 식별용 해시 생성"""
+    h = hashlib.blake2b(digest_size=8)
+    for column in (hanjas, readings, meanings):
+        h.update("\n".join(column).encode('utf-8'))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def get_state_filepath(cache_filename):
+    """캐시 파일에 대응하는 학습 상태(섞기 순서 + 진행 위치) 파일 경로"""
+    return os.path.join(DATA_DIR, os.path.splitext(cache_filename)[0] + ".state.npz")
+
+
+def load_cache_state(cache_filename, count):
+    """저장된 학습 상태 로드 -> (섞기 순서 int32 배열, 순서상 진행 위치)
+    
+    없거나 데이터 개수와 맞지 않으면 None
+    """
+    state_filepath = get_state_filepath(cache_filename)
+    if os.path.exists(state_filepath):
+        try:
+            with np.load(state_filepath) as state:
+                order = state["order"]
+                position = int(state["position"])
+        except Exception:
+            return None
+        if order.dtype == np.int32 and len(order) == count and 0 <= position < max(count, 1):
+            return order, position
+    return None
+
+
+def save_cache_state(cache_filename, order, position):
+    """섞기 순서(int32 인덱스)와 진행 위치를 상태 파일로 저장"""
+    ensure_data_dir()
+    np.savez(
+        get_state_filepath(cache_filename),
+        order=order.astype(np.int32, copy=False),
+        position=np.int32(position)
+    )
+
+
+def remove_cache_file(cache_filename):
+    """캐시 파일과 학습 상태 파일 삭제"""
+    for path in (os.path.join(DATA_DIR, cache_filename), get_state_filepath(cache_filename)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
 
 
 def load_from_cache(cache_filename):
-    """캐시에서 데이터 로드"""
+    """캐시에서 데이터 로드 -> (한자, 음, 뜻) 리스트 튜플"""
     cache_filepath = os.path.join(DATA_DIR, cache_filename)
     if os.path.exists(cache_filepath):
-        with open(cache_filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(cache_filepath, 'rb') as f:
+            data = json_loads_bytes(f.read())
+        if isinstance(data, list):
+            # 이전 형식: [{'hanja', 'reading', 'meaning'}, ...]
+            return (
+                [h['hanja'] for h in data],
+                [h['reading'] for h in data],
+                [h['meaning'] for h in data],
+            )
+        return data["hanja"], data["reading"], data["meaning"]
     return None
 
 
+def read_excel_file(file_path):
+    """엑셀 파일에서 필요한 열(1~4열)만 문자열로 읽기 (첫 줄은 헤더)
+    
+    열이 4개보다 적어도 오류 없이 있는 열만 읽는다.
+    """
+    return pd.read_excel(
+        file_path,
+        engine=EXCEL_ENGINE,
+        header=None,
+        skiprows=1,
+        usecols=lambda c: c in DATA_COLUMNS,
+        dtype=str,
+        na_filter=False
+    )
+
+
+def read_csv_columns(stream):
+    """CSV 스트림에서 필요한 열(1~4열)만 문자열로 읽기 (첫 줄은 헤더)
+    
+    열이 4개보다 적어도 오류 없이 있는 열만 읽는다.
+    """
+    if pacsv is None:
+        # 위치 기반 usecols는 열이 모자라면 오류가 나므로 읽은 뒤 자름
+        df = pd.read_csv(
+            stream,
+            dtype=str,
+            na_filter=False,
+            encoding='utf-8'
+        )
+        return df.iloc[:, :len(DATA_COLUMNS)]
+    
+    # 헤더 이름 대신 위치(f0~f3)로 열을 고르고, 헤더 줄은 건너뜀
+    columns = [f"f{i}" for i in DATA_COLUMNS]
+    table = pacsv.read_csv(
+        stream,
+        read_options=pacsv.ReadOptions(
+            autogenerate_column_names=True,
+            skip_rows_after_names=1
+        ),
+        # 줄바꿈이 들어간 셀은 따옴표 안에 개행이 있는 값으로 내보내짐
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            include_missing_columns=True,
+            column_types={column: pa.string() for column in columns}
+        )
+    )
+    # 시트에 없는 열은 전부 null로 채워지므로 제외 (빈 칸은 null이 아닌 "")
+    present = [
+        column for column in columns
+        if table.num_rows and table.column(column).null_count < table.num_rows
+    ]
+    return table.select(present).to_pandas()
+
+
+def read_google_sheet_csv(csv_url, file_info=None):
+    """구글 시트 CSV를 응답 스트림에서 바로 읽기 (필요한 열만 문자열로)
+    
+    file_info에 이전 ETag/Last-Modified가 있으면 조건부 요청을 보낸다.
+    반환: (DataFrame, validators) / 변경 없음(304)이면 (None, None)
+    """
+    headers = {}
+    if file_info:
+        if file_info.get("etag"):
+            headers["If-None-Match"] = file_info["etag"]
+        if file_info.get("last_modified"):
+            headers["If-Modified-Since"] = file_info["last_modified"]
+    
+    try:
+        with urlopen(Request(csv_url, headers=headers), timeout=30) as response:
+            df = read_csv_columns(response)
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+    except HTTPError as e:
+        if e.code == 304:
+            return None, None
+        raise
+    
+    return df, validators
+
+
+def parse_dataframe(df):
+    """데이터프레임에서 한자 데이터 추출 -> (한자, 음, 뜻) 리스트 튜플"""
+    if df.shape[1] < 4:
+        return [], [], []
+    
+    # 2~4열(한자/음/뜻)을 한 번에 문자열 배열로 변환
+    arr = df.iloc[:, 1:4].fillna("").astype(str).to_numpy()
+    hanja_col = arr[:, 0]
+    mask = (hanja_col != "") & (hanja_col != "nan") & (hanja_col != "한자")
+    
+    rows = arr[mask]
+    return rows[:, 0].tolist(), rows[:, 1].tolist(), rows[:, 2].tolist()
+
+
+@lru_cache(maxsize=64)
 def extract_google_sheet_id(url):
     """구글 시트 URL에서 ID 추출"""
-    patterns = [
-        r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-        r'id=([a-zA-Z0-9-_]+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in GOOGLE_SHEET_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     return None
 
 
+@lru_cache(maxsize=64)
 def get_google_sheet_csv_url(sheet_url, gid="0"):
     """구글 시트 CSV 다운로드 URL 생성"""
     sheet_id = extract_google_sheet_id(sheet_url)
@@ -182,6 +450,70 @@ def get_google_sheet_csv_url(sheet_url, gid="0"):
     return None
 
 
+def load_local_excel_source(name, file_path):
+    """로컬 엑셀 파일 읽기 + 파싱 + 캐시 저장"""
+    hanjas, readings, meanings = parse_dataframe(read_excel_file(file_path))
+    cache_file, stale_files = None, []
+    if hanjas:
+        cache_file, stale_files = add_to_cache(name, "local", file_path,
+                                               hanjas, readings, meanings)
+    return (hanjas, readings, meanings), cache_file, stale_files
+
+
+def load_google_sheet_source(name, url, csv_url):
+    """구글 시트 내려받기 + 파싱 + 캐시 저장
+    
+    이전에 받은 시트가 그대로면(304) 파싱/저장 없이 캐시된 데이터를 사용하고
+    인덱스 항목만 최신으로 갱신한다.
+    """
+    file_info = load_cache_index()["files"].get(url)
+    df, validators = read_google_sheet_csv(csv_url, file_info)
+    
+    if df is None:
+        data = load_from_cache(file_info["cache_file"])
+        if data is not None:
+            stale_files = touch_cache_entry(file_info, name)
+            return data, file_info["cache_file"], stale_files
+        # 캐시 파일이 없어졌으면 조건 없이 다시 받기
+        df, validators = read_google_sheet_csv(csv_url)
+    
+    hanjas, readings, meanings = parse_dataframe(df)
+    cache_file, stale_files = None, []
+    if hanjas:
+        cache_file, stale_files = add_to_cache(name, "google", url,
+                                               hanjas, readings, meanings, validators)
+    return (hanjas, readings, meanings), cache_file, stale_files
+
+
+class LoadWorkerSignals(QObject):
+    """LoadWorker 결과 전달용 시그널"""
+    # (한자, 음, 뜻), 캐시 파일명, 삭제할 캐시 파일명들, 이름, 소스 타입
+    finished = pyqtSignal(object, object, object, str, str)
+    error = pyqtSignal(str, str)  # 소스 타입, 오류 메시지
+
+
+class LoadWorker(QRunnable):
+    """파일 읽기 + 파싱 + 캐시 저장을 백그라운드 스레드에서 수행
+    
+    오래된 캐시 파일은 UI가 현재 학습 상태를 저장한 뒤 지우도록 결과와 함께 넘긴다.
+    """
+    def __init__(self, name, source_type, load_func):
+        super().__init__()
+        self.name = name
+        self.source_type = source_type
+        self.load_func = load_func  # 호출 시 ((한자, 음, 뜻), 캐시 파일명, 삭제할 캐시 파일명들) 반환
+        self.signals = LoadWorkerSignals()
+    
+    def run(self):
+        try:
+            data, cache_file, stale_files = self.load_func()
+        except Exception as e:
+            self.signals.error.emit(self.source_type, str(e))
+            return
+        
+        self.signals.finished.emit(data, cache_file, stale_files, self.name, self.source_type)
+
+
 class GoogleSheetDialog(QDialog):
     """구글 시트 URL 입력 다이얼로그"""
     def __init__(self, parent=None):
@@ -261,14 +593,70 @@ class GoogleSheetDialog(QDialog):
 
 
 class HanjaMemorizer(QMainWindow):
+    # 상태에 따라 바뀌는 스타일시트 (매번 새 문자열을 만들지 않도록 한 번만 정의)
+    STYLE_START_BUTTON = """
+        QPushButton {
+            background-color: #4ecca3;
+            color: #1a1a2e;
+            border: none;
+            padding: 12px 24px;
+            font-size: 14px;
+            font-weight: bold;
+            border-radius: 8px;
+        }
+        QPushButton:hover {
+            background-color: #7ed6b9;
+        }
+        QPushButton:disabled {
+            background-color: #555;
+            color: #888;
+        }
+    """
+    STYLE_STOP_BUTTON = """
+        QPushButton {
+            background-color: #e94560;
+            color: white;
+            border: none;
+            padding: 12px 24px;
+            font-size: 14px;
+            font-weight: bold;
+            border-radius: 8px;
+        }
+        QPushButton:hover {
+            background-color: #ff6b6b;
+        }
+    """
+    STYLE_HANJA_ACTIVE = """
+        QLabel {
+            color: #ffffff;
+            font-size: 150px;
+            font-weight: bold;
+        }
+    """
+    STYLE_HANJA_DIM = """
+        QLabel {
+            color: #888888;
+            font-size: 150px;
+            font-weight: bold;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
-        self.hanja_list_full = []  # 전체 한자 리스트
-        self.hanja_list = []  # 현재 표시할 한자 리스트 (필터링됨)
+        # 전체 한자 데이터 (한자/음/뜻 병렬 리스트)
+        self.hanjas = []
+        self.readings = []
+        self.meanings = []
+        self.cache_file = None  # 현재 데이터의 캐시 파일명
+        self.full_order = np.empty(0, dtype=np.int32)  # 전체 한자의 섞기 순서
+        self.order = np.empty(0, dtype=np.int32)  # 현재 표시할 한자 인덱스 (필터링 + 섞기)
+        self.rng = np.random.default_rng()
         self.current_index = 0
         self.showing_hanja = True
+        self.hanja_dimmed = False  # 음/뜻 표시 중 한자를 흐리게 했는지
         self.is_running = False
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.toggle_display)
         
         self.hanja_time = 2000
@@ -277,6 +665,8 @@ class HanjaMemorizer(QMainWindow):
         # 모드: "all" = 전체, "unmemorized" = 미암기만
         self.current_mode = "all"
         
+        self.load_worker = None  # 진행 중인 백그라운드 로드 작업
+        
         self.init_ui()
         self.load_cache_dropdown()
         
@@ -565,24 +955,7 @@ class HanjaMemorizer(QMainWindow):
         # 시작/정지 버튼
         self.start_btn = QPushButton("▶ 시작")
         self.start_btn.setEnabled(False)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4ecca3;
-                color: #1a1a2e;
-                border: none;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #7ed6b9;
-            }
-            QPushButton:disabled {
-                background-color: #555;
-                color: #888;
-            }
-        """)
+        self.start_btn.setStyleSheet(self.STYLE_START_BUTTON)
         self.start_btn.clicked.connect(self.toggle_start)
         control_layout.addWidget(self.start_btn)
         
@@ -697,13 +1070,7 @@ class HanjaMemorizer(QMainWindow):
         # 한자 표시
         self.hanja_label = QLabel("漢字")
         self.hanja_label.setAlignment(Qt.AlignCenter)
-        self.hanja_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 150px;
-                font-weight: bold;
-            }
-        """)
+        self.hanja_label.setStyleSheet(self.STYLE_HANJA_ACTIVE)
         display_layout.addWidget(self.hanja_label)
         
         self.reading_label = QLabel("")
@@ -784,18 +1151,23 @@ class HanjaMemorizer(QMainWindow):
         self.update_memorized_stats()
     
     def load_cache_dropdown(self):
-        """캐시된 파일 목록을 드롭다운에 로드"""
-        self.cache_combo.clear()
-        self.cache_combo.addItem("-- 저장된 파일 선택 --", None)
-        
-        index = load_cache_index()
-        for file_info in index.get("files", []):
-            display_name = f"{file_info['name']} ({file_info['count']}개)"
-            if file_info['source_type'] == 'google':
-                display_name = f"☁️ {display_name}"
-            else:
-                display_name = f"💻 {display_name}"
-            self.cache_combo.addItem(display_name, file_info)
+        """캐시된 파일 목록을 드롭다운에 로드
+        
+        항목을 하나씩 추가하지 않고 새 모델을 만든 뒤 한 번에 교체한다.
+        """
+        items = [QStandardItem("-- 저장된 파일 선택 --")]
+        
+        files = load_cache_index().get("files", {})
+        for file_info in reversed(files.values()):
+            icon = SOURCE_TYPE_ICONS.get(file_info['source_type'], "💻")
+            item = QStandardItem(f"{icon} {file_info['name']} ({file_info['count']}개)")
+            item.setData(file_info, Qt.UserRole)
+            items.append(item)
+        
+        # 부모가 콤보박스인 이전 모델은 setModel에서 함께 삭제됨
+        model = QStandardItemModel(self.cache_combo)
+        model.invisibleRootItem().appendRows(items)
+        self.cache_combo.setModel(model)
     
     def load_from_cache_selected(self):
         """선택된 캐시 파일 로드"""
@@ -806,8 +1178,7 @@ class HanjaMemorizer(QMainWindow):
         
         data = load_from_cache(file_info['cache_file'])
         if data:
-            self.hanja_list_full = data
-            self.apply_mode_filter()
+            self.set_hanja_data(data, file_info['cache_file'])
             self.on_data_loaded(file_info['name'])
         else:
             QMessageBox.critical(self, "오류", "캐시 파일을 찾을 수 없습니다.")
@@ -822,28 +1193,10 @@ class HanjaMemorizer(QMainWindow):
         )
         
         if file_path:
-            try:
-                df = pd.read_excel(file_path)
-                data = self.parse_dataframe(df)
-                
-                if data:
-                    filename = os.path.basename(file_path)
-                    name = os.path.splitext(filename)[0]
-                    add_to_cache(name, "local", file_path, data)
-                    
-                    self.hanja_list_full = data
-                    self.apply_mode_filter()
-                    self.on_data_loaded(name)
-                    self.load_cache_dropdown()
-                    
-                    QMessageBox.information(
-                        self,
-                        "로드 완료",
-                        f"{len(self.hanja_list_full)}개의 한자를 로드했습니다."
-                    )
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"파일 읽기 오류:\n{str(e)}")
+            filename = os.path.basename(file_path)
+            name = os.path.splitext(filename)[0]
+            self.start_load_worker(name, "local",
+                                   partial(load_local_excel_source, name, file_path))
     
     def load_google_sheet(self):
         """구글 시트에서 로드"""
@@ -861,54 +1214,63 @@ class HanjaMemorizer(QMainWindow):
                 QMessageBox.critical(self, "오류", "올바른 구글 시트 URL이 아닙니다.")
                 return
             
-            try:
-                df = pd.read_csv(csv_url)
-                data = self.parse_dataframe(df)
-                
-                if data:
-                    add_to_cache(name, "google", url, data)
-                    
-                    self.hanja_list_full = data
-                    self.apply_mode_filter()
-                    self.on_data_loaded(name)
-                    self.load_cache_dropdown()
-                    
-                    QMessageBox.information(
-                        self,
-                        "로드 완료",
-                        f"구글 시트에서 {len(self.hanja_list_full)}개의 한자를 로드했습니다."
-                    )
-                else:
-                    QMessageBox.warning(self, "알림", "데이터를 찾을 수 없습니다.")
-                    
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "오류",
-                    f"구글 시트 로드 실패:\n{str(e)}\n\n"
-                    "시트가 '링크가 있는 모든 사용자에게 공개'로 설정되어 있는지 확인해주세요."
-                )
+            self.start_load_worker(name, "google",
+                                   partial(load_google_sheet_source, name, url, csv_url))
+    
+    def start_load_worker(self, name, source_type, load_func):
+        """백그라운드에서 파일 로드 시작"""
+        self.set_loading(True)
+        self.load_worker = LoadWorker(name, source_type, load_func)
+        self.load_worker.signals.finished.connect(self.on_load_finished)
+        self.load_worker.signals.error.connect(self.on_load_error)
+        QThreadPool.globalInstance().start(self.load_worker)
+    
+    def set_loading(self, loading):
+        """로드 중에는 불러오기 버튼 비활성화"""
+        self.load_cache_btn.setEnabled(not loading)
+        self.local_btn.setEnabled(not loading)
+        self.google_btn.setEnabled(not loading)
     
-    def parse_dataframe(self, df):
-        """데이터프레임에서 한자 데이터 추출"""
-        data = []
+    def on_load_finished(self, data, cache_file, stale_files, name, source_type):
+        """백그라운드 로드 완료 시"""
+        self.set_loading(False)
         
-        for _, row in df.iterrows():
+        if not data[0]:
+            if source_type == "google":
+                QMessageBox.warning(self, "알림", "데이터를 찾을 수 없습니다.")
+            return
+        
+        # 이전 파일의 학습 상태를 저장한 뒤에 더 이상 쓰이지 않는 캐시 파일 삭제
+        self.set_hanja_data(data, cache_file)
+        for stale_file in stale_files:
             try:
-                hanja = str(row.iloc[1]) if pd.notna(row.iloc[1]) else ""
-                reading = str(row.iloc[2]) if pd.notna(row.iloc[2]) else ""
-                meaning = str(row.iloc[3]) if pd.notna(row.iloc[3]) else ""
-                
-                if hanja and hanja != "nan" and hanja != "한자":
-                    data.append({
-                        'hanja': hanja,
-                        'reading': reading,
-                        'meaning': meaning
-                    })
-            except:
-                continue
-        
-        return data
+                remove_cache_file(stale_file)
+            except OSError:
+                pass
+        
+        self.on_data_loaded(name)
+        self.load_cache_dropdown()
+        
+        source_text = "구글 시트에서 " if source_type == "google" else ""
+        QMessageBox.information(
+            self,
+            "로드 완료",
+            f"{source_text}{len(self.hanjas)}개의 한자를 로드했습니다."
+        )
+    
+    def on_load_error(self, source_type, message):
+        """백그라운드 로드 실패 시"""
+        self.set_loading(False)
+        
+        if source_type == "google":
+            QMessageBox.critical(
+                self,
+                "오류",
+                f"구글 시트 로드 실패:\n{message}\n\n"
+                "시트가 '링크가 있는 모든 사용자에게 공개'로 설정되어 있는지 확인해주세요."
+            )
+        else:
+            QMessageBox.critical(self, "오류", f"파일 읽기 오류:\n{message}")
     
     def on_mode_changed(self, checked):
         """모드 변경 시"""
@@ -917,26 +1279,60 @@ class HanjaMemorizer(QMainWindow):
         else:
             self.current_mode = "unmemorized"
         
-        if self.hanja_list_full:
+        if self.hanjas:
+            self.rng.shuffle(self.full_order)
             self.apply_mode_filter()
             self.update_display_after_filter()
+            self.save_progress()
+    
+    def set_hanja_data(self, data, cache_file):
+        """불러온 데이터 설정 (저장된 섞기 순서와 진행 위치가 있으면 이어서 학습)"""
+        self.save_progress()
+        
+        self.hanjas, self.readings, self.meanings = data
+        self.cache_file = cache_file
+        
+        state = load_cache_state(cache_file, len(self.hanjas))
+        if state is None:
+            state = (self.rng.permutation(len(self.hanjas)).astype(np.int32), 0)
+            save_cache_state(cache_file, *state)
+        self.full_order, position = state
+        self.apply_mode_filter()
+        self.current_index = self.index_for_position(position)
+    
+    def save_progress(self):
+        """현재 섞기 순서와 진행 위치를 상태 파일에 저장"""
+        if not self.cache_file or not len(self.full_order):
+            return
+        
+        position = 0
+        if len(self.order):
+            current = self.order[self.current_index]
+            position = int(np.flatnonzero(self.full_order == current)[0])
+        save_cache_state(self.cache_file, self.full_order, position)
+    
+    def index_for_position(self, position):
+        """전체 섞기 순서상의 위치를 현재 표시 목록의 인덱스로 변환"""
+        index = int(np.count_nonzero(np.isin(self.full_order[:position], self.order)))
+        return index if index < len(self.order) else 0
     
     def apply_mode_filter(self):
-        """현재 모드에 따라 한자 리스트 필터링"""
+        """현재 모드에 따라 한자 리스트 필터링 (섞기 순서 유지)"""
         if self.current_mode == "all":
-            self.hanja_list = self.hanja_list_full.copy()
+            self.order = self.full_order
         else:
-            # 미암기 한자만 필터링
-            self.hanja_list = [
-                h for h in self.hanja_list_full 
-                if not is_memorized(h['hanja'])
-            ]
-        
-        random.shuffle(self.hanja_list)
+            # 미암기 한자만 필터링 (개수를 알고 있으므로 마스크를 미리 할당)
+            memorized = set(load_memorized_hanja()["memorized"])
+            unmemorized = np.fromiter(
+                (hanja not in memorized for hanja in self.hanjas),
+                dtype=bool,
+                count=len(self.hanjas)
+            )
+            self.order = self.full_order[unmemorized[self.full_order]]
     
     def update_display_after_filter(self):
         """필터링 후 디스플레이 업데이트"""
-        if not self.hanja_list:
+        if not len(self.order):
             if self.current_mode == "unmemorized":
                 QMessageBox.information(self, "알림", "모든 한자를 암기했습니다! 🎉")
             self.hanja_label.setText("완료!")
@@ -946,8 +1342,8 @@ class HanjaMemorizer(QMainWindow):
             return
         
         self.current_index = 0
-        self.count_label.setText(f"총 {len(self.hanja_list)}개 한자")
-        self.progress_bar.setMaximum(len(self.hanja_list))
+        self.count_label.setText(f"총 {len(self.order)}개 한자")
+        self.progress_bar.setMaximum(len(self.order))
         self.update_progress()
         self.show_current_hanja()
         self.start_btn.setEnabled(True)
@@ -955,8 +1351,8 @@ class HanjaMemorizer(QMainWindow):
     def on_data_loaded(self, name):
         """데이터 로드 완료 시 UI 업데이트"""
         self.file_label.setText(f"파일: {name}")
-        self.count_label.setText(f"총 {len(self.hanja_list)}개 한자")
-        self.progress_bar.setMaximum(len(self.hanja_list))
+        self.count_label.setText(f"총 {len(self.order)}개 한자")
+        self.progress_bar.setMaximum(len(self.order))
         self.progress_bar.setValue(0)
         
         self.start_btn.setEnabled(True)
@@ -964,18 +1360,16 @@ class HanjaMemorizer(QMainWindow):
         self.prev_btn.setEnabled(True)
         self.next_btn.setEnabled(True)
         
-        self.current_index = 0
         self.update_progress()
         self.show_current_hanja()
         self.update_memorized_stats()
     
     def on_memorized_toggled(self, checked):
         """암기완료 체크박스 토글 시"""
-        if not self.hanja_list:
+        if not len(self.order):
             return
         
-        current = self.hanja_list[self.current_index]
-        hanja = current['hanja']
+        hanja = self.hanjas[self.order[self.current_index]]
         
         if checked:
             add_memorized(hanja)
@@ -987,7 +1381,7 @@ class HanjaMemorizer(QMainWindow):
     def update_memorized_stats(self):
         """암기 통계 업데이트"""
         memorized_count = get_memorized_count()
-        total_count = len(self.hanja_list_full) if self.hanja_list_full else 0
+        total_count = len(self.hanjas)
         
         if total_count > 0:
             percentage = (memorized_count / total_count) * 100
@@ -998,9 +1392,11 @@ class HanjaMemorizer(QMainWindow):
             self.memorized_stats_label.setText(f"암기완료: {memorized_count}개")
     
     def shuffle_hanja(self):
-        if self.hanja_list:
-            random.shuffle(self.hanja_list)
+        if len(self.order):
+            self.rng.shuffle(self.full_order)
+            self.apply_mode_filter()
             self.current_index = 0
+            self.save_progress()
             self.update_progress()
             self.show_current_hanja()
             QMessageBox.information(self, "섞기 완료", "한자 순서를 랜덤으로 섞었습니다.")
@@ -1018,25 +1414,12 @@ class HanjaMemorizer(QMainWindow):
             self.start_memorizing()
     
     def start_memorizing(self):
-        if not self.hanja_list:
+        if not len(self.order):
             return
             
         self.is_running = True
         self.start_btn.setText("⏹ 정지")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e94560;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-        """)
+        self.start_btn.setStyleSheet(self.STYLE_STOP_BUTTON)
         
         self.showing_hanja = True
         self.show_current_hanja()
@@ -1046,101 +1429,91 @@ class HanjaMemorizer(QMainWindow):
         self.is_running = False
         self.timer.stop()
         self.start_btn.setText("▶ 시작")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4ecca3;
-                color: #1a1a2e;
-                border: none;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #7ed6b9;
-            }
-        """)
+        self.start_btn.setStyleSheet(self.STYLE_START_BUTTON)
+        self.save_progress()
     
     def toggle_display(self):
-        if not self.hanja_list:
+        if not len(self.order):
             return
             
         if self.showing_hanja:
             self.showing_hanja = False
             self.show_reading_meaning()
-            self.timer.start(self.meaning_time)
         else:
             self.showing_hanja = True
-            self.current_index = (self.current_index + 1) % len(self.hanja_list)
+            self.current_index = (self.current_index + 1) % len(self.order)
             self.update_progress()
             self.show_current_hanja()
-            self.timer.start(self.hanja_time)
+        
+        self.schedule_next_phase()
+    
+    def schedule_next_phase(self):
+        """현재 단계의 표시 시간으로 타이머 설정
+        
+        반복 타이머이므로 간격이 그대로면 다시 시작하지 않는다.
+        """
+        interval = self.hanja_time if self.showing_hanja else self.meaning_time
+        if self.timer.interval() != interval:
+            self.timer.start(interval)
     
     def show_current_hanja(self):
-        if not self.hanja_list:
+        if not len(self.order):
             return
             
-        current = self.hanja_list[self.current_index]
-        self.hanja_label.setText(current['hanja'])
+        hanja = self.hanjas[self.order[self.current_index]]
+        self.hanja_label.setText(hanja)
         self.reading_label.setText("")
         self.meaning_label.setText("")
         
         # 암기완료 체크박스 상태 업데이트
         self.memorized_checkbox.blockSignals(True)
-        self.memorized_checkbox.setChecked(is_memorized(current['hanja']))
+        self.memorized_checkbox.setChecked(is_memorized(hanja))
         self.memorized_checkbox.blockSignals(False)
         
-        self.hanja_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 150px;
-                font-weight: bold;
-            }
-        """)
+        if self.hanja_dimmed:
+            self.hanja_label.setStyleSheet(self.STYLE_HANJA_ACTIVE)
+            self.hanja_dimmed = False
     
     def show_reading_meaning(self):
-        if not self.hanja_list:
+        if not len(self.order):
             return
             
-        current = self.hanja_list[self.current_index]
-        self.reading_label.setText(current['reading'])
-        self.meaning_label.setText(current['meaning'])
+        i = self.order[self.current_index]
+        self.reading_label.setText(self.readings[i])
+        self.meaning_label.setText(self.meanings[i])
         
-        self.hanja_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 150px;
-                font-weight: bold;
-            }
-        """)
+        if not self.hanja_dimmed:
+            self.hanja_label.setStyleSheet(self.STYLE_HANJA_DIM)
+            self.hanja_dimmed = True
     
     def update_progress(self):
-        if self.hanja_list:
-            self.progress_label.setText(f"진행: {self.current_index + 1} / {len(self.hanja_list)}")
-            self.progress_bar.setValue(self.current_index + 1)
+        if len(self.order):
+            value = self.current_index + 1
+            self.progress_label.setText(f"진행: {value} / {len(self.order)}")
+            # 값이 그대로면 진행바는 건드리지 않음
+            if self.progress_bar.value() != value:
+                self.progress_bar.setValue(value)
     
     def prev_hanja(self):
-        if not self.hanja_list:
+        if not len(self.order):
             return
-        self.current_index = (self.current_index - 1) % len(self.hanja_list)
+        self.current_index = (self.current_index - 1) % len(self.order)
         self.showing_hanja = True
         self.update_progress()
         self.show_current_hanja()
         
         if self.is_running:
-            self.timer.stop()
             self.timer.start(self.hanja_time)
     
     def next_hanja(self):
-        if not self.hanja_list:
+        if not len(self.order):
             return
-        self.current_index = (self.current_index + 1) % len(self.hanja_list)
+        self.current_index = (self.current_index + 1) % len(self.order)
         self.showing_hanja = True
         self.update_progress()
         self.show_current_hanja()
         
         if self.is_running:
-            self.timer.stop()
             self.timer.start(self.hanja_time)
     
     def keyPressEvent(self, event):
@@ -1155,6 +1528,10 @@ class HanjaMemorizer(QMainWindow):
         elif event.key() == Qt.Key_M:
             # M키로 암기완료 토글
             self.memorized_checkbox.setChecked(not self.memorized_checkbox.isChecked())
+    
+    def closeEvent(self, event):
+        self.save_progress()
+        super().closeEvent(event)
 
 
 def main():